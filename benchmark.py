@@ -0,0 +1,60 @@
+"""Micro-benchmarks for friendly-id.
+
+Run with ``python benchmark.py``.
+"""
+
+import time
+import uuid
+
+from friendly_id.friendly_id import FriendlyUUID, decode, encode
+
+
+class Benchmark:
+    def __init__(self, count: int = 10000):
+        self.count = count
+        self.friendly_uuids = FriendlyUUID.random_batch(count)
+        self.standard_uuids = [f.to_uuid() for f in self.friendly_uuids]
+
+    def benchmark_encode(self) -> float:
+        start = time.perf_counter()
+        for u in self.standard_uuids:
+            encode(u)
+        return time.perf_counter() - start
+
+    def benchmark_decode(self) -> float:
+        friendly_strings = [encode(u) for u in self.standard_uuids]
+        start = time.perf_counter()
+        for s in friendly_strings:
+            decode(s)
+        return time.perf_counter() - start
+
+    def benchmark_bandwidth_efficiency(self) -> dict:
+        friendly_strings = [encode(u) for u in self.standard_uuids]
+        # str(uuid) is always 36 ASCII characters and base62 is pure
+        # ASCII, so character counts equal UTF-8 byte counts; no need to
+        # encode every string just to measure it.
+        uuid_bytes = 36 * self.count
+        friendly_bytes = sum(map(len, friendly_strings))
+        return {
+            "uuid_bytes": uuid_bytes,
+            "friendly_bytes": friendly_bytes,
+            "savings": 1 - friendly_bytes / uuid_bytes,
+        }
+
+
+def main():
+    bench = Benchmark()
+    count = bench.count
+    encode_s = bench.benchmark_encode()
+    decode_s = bench.benchmark_decode()
+    bandwidth = bench.benchmark_bandwidth_efficiency()
+    print(f"encode: {encode_s / count * 1e6:.2f} us/id")
+    print(f"decode: {decode_s / count * 1e6:.2f} us/id")
+    print(
+        "bandwidth: {friendly_bytes} vs {uuid_bytes} bytes "
+        "({savings:.1%} smaller)".format(**bandwidth)
+    )
+
+
+if __name__ == "__main__":
+    main()
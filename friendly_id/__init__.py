@@ -1,4 +1,5 @@
 from friendly_id.friendly_id import friendly_id
 from friendly_id.friendly_id import encode, decode
+from friendly_id.friendly_id import FriendlyUUID
 
 __version__ = "0.3.3"
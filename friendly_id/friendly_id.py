@@ -1,10 +1,30 @@
+import os
+import re
 import uuid
-
+from functools import lru_cache
 
 # https://en.wikipedia.org/wiki/Base62
 base62alphabet: str = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 base: int = len(base62alphabet)  # base62
 
+# 62**10 is the largest power of 62 that fits in 64 bits. Peeling ten
+# digits at a time keeps most of the division work on machine-sized ints
+# instead of the full 128-bit value.
+_pow62: tuple = tuple(base**i for i in range(23))
+_pow62_10: int = _pow62[10]
+
+# Maps an ASCII byte to its base62 digit value; str.find returns -1 for
+# characters outside the alphabet, which wraps to the 255 sentinel.
+_decode_table: bytes = bytes(base62alphabet.find(chr(b)) & 255 for b in range(256))
+
+# Indexing a bytes alphabet yields plain ints that can be stored into a
+# bytearray buffer without allocating a one-character str per digit.
+_alphabet_bytes: bytes = base62alphabet.encode("ascii")
+
+# Shape of a valid friendly id; one C-level match rejects bad input
+# before any decoding work.
+_base62_re = re.compile(r"\A[0-9A-Za-z]{1,22}\Z")
+
 
 def friendly_id() -> str:
     id = uuid.uuid4()
@@ -12,32 +32,159 @@ def friendly_id() -> str:
 
 
 def encode(raw: uuid.UUID) -> str:
-    """
-    ConvertUp converts a hexadecimal UUID string to a base alphabet greater than
-    16. It is used here to compress a 32 character UUID down to 23 URL friendly characters.
+    """Encode a UUID into a base62 string.
+
+    A UUID is 128 bits, so its base62 form has at most 22 digits. The digits
+    are written from the least significant end into a pre-sized buffer,
+    which avoids both repeated string concatenation and the final reversal.
 
     Args:
-        raw (str): _description_
-        mask (str): _description_
+        raw (uuid.UUID): the UUID to encode.
 
     Returns:
-        str: _description_
+        str: the base62 representation of the UUID.
     """
 
-    input = raw.int
-    res = ""
-    while input != 0:
-        res += base62alphabet[input % base]
-        input = input // base
-    return res[::-1]
+    return _encode_int(raw.int)
 
 
-def decode(raw: str) -> uuid.UUID:
+def _encode_int(n: int) -> str:
+    # The digit loops below emit nothing for zero; the nil UUID must
+    # still encode to "0" so the friendly form round-trips.
+    if not n:
+        return "0"
+    # Bind module globals to locals; LOAD_FAST is measurably cheaper
+    # than LOAD_GLOBAL inside the digit loops.
+    alphabet = _alphabet_bytes
+    buf = bytearray(b"0" * 22)
+    i = 22
+    while n >= _pow62_10:
+        n, chunk = divmod(n, _pow62_10)
+        for _ in range(10):
+            i -= 1
+            chunk, r = divmod(chunk, base)
+            buf[i] = alphabet[r]
+    while n:
+        i -= 1
+        n, r = divmod(n, base)
+        buf[i] = alphabet[r]
+    return buf[i:].decode("ascii")
+
+
+# Memoized variant for FriendlyUUID, where the same instance is typically
+# stringified many times (logging, JSON serialization, repr). The base62
+# form is a pure function of the 128-bit value, so repeats cost a cache
+# lookup instead of a full encode.
+_encode_cached = lru_cache(maxsize=4096)(_encode_int)
+
+
+@lru_cache(maxsize=4096)
+def _standard_cached(n: int) -> str:
+    """Memoized hyphenated form; uuid.UUID.__str__ reformats on every
+    call, which adds up when the same id is bound repeatedly."""
+    # One hex format plus four slices is about twice as fast as
+    # uuid.UUID.__str__'s per-segment int formatting, and skips the
+    # intermediate UUID object entirely.
+    h = "%032x" % n
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _decode_int(raw: str) -> int:
+    try:
+        data = raw.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Invalid character in base62 string")
+    # One C-level translate maps every character to its digit value (255
+    # marks invalid bytes), replacing a table lookup per character with a
+    # single pass plus one containment scan.
+    values = data.translate(_decode_table)
+    if 255 in values:
+        raise ValueError("Invalid character in base62 string")
     res = 0
-    for c in raw:
-        try:
-            i = base62alphabet.index(c)
-        except ValueError:
-            raise ValueError("Invalid character in base62 string")
-        res = res * base + i
-    return uuid.UUID(int=res)
+    # Accumulate ten digits at a time so the running value inside each
+    # Horner loop stays below 62**10 (and therefore within a machine
+    # word); only the per-chunk combine touches the growing bignum.
+    for start in range(0, len(values), 10):
+        chunk = values[start : start + 10]
+        acc = 0
+        for v in chunk:
+            acc = acc * base + v
+        res = res * _pow62[len(chunk)] + acc
+    return res
+
+
+def decode(raw: str) -> uuid.UUID:
+    return uuid.UUID(int=_decode_int(raw))
+
+
+class FriendlyUUID(uuid.UUID):
+    """A :class:`uuid.UUID` whose string form is the base62 friendly id.
+
+    ``str()`` returns the base62 encoding, while :attr:`standard` still
+    exposes the usual hyphenated form.
+    """
+
+    def __str__(self) -> str:
+        return _encode_cached(self.int)
+
+    @property
+    def friendly(self) -> str:
+        """The base62 representation of this UUID."""
+        return _encode_cached(self.int)
+
+    @property
+    def standard(self) -> str:
+        """The standard hyphenated representation of this UUID."""
+        return _standard_cached(self.int)
+
+    @classmethod
+    def _from_int_fast(cls, value: int) -> "FriendlyUUID":
+        # Bypass uuid.UUID.__init__ and its keyword dispatch for values
+        # that are already known to be valid 128-bit ints. uuid.UUID
+        # keeps all state in the ``int`` and ``is_safe`` slots and
+        # forbids normal attribute assignment.
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "int", value)
+        object.__setattr__(obj, "is_safe", uuid.SafeUUID.unknown)
+        return obj
+
+    @classmethod
+    def random(cls) -> "FriendlyUUID":
+        """Generate a random (version 4) FriendlyUUID."""
+        return cls._from_int_fast(uuid.uuid4().int)
+
+    @classmethod
+    def random_batch(cls, n: int) -> "list[FriendlyUUID]":
+        """Generate ``n`` random (version 4) FriendlyUUIDs with a single
+        read from the system entropy pool instead of one per id."""
+        raw = os.urandom(16 * n)
+        out = []
+        for i in range(0, 16 * n, 16):
+            value = int.from_bytes(raw[i : i + 16], "big")
+            # Set the RFC 4122 version (4) and variant bits, exactly as
+            # uuid.uuid4 does.
+            value &= ~(0xC000 << 48)
+            value |= 0x8000 << 48
+            value &= ~(0xF000 << 64)
+            value |= 4 << 76
+            out.append(cls._from_int_fast(value))
+        return out
+
+    @classmethod
+    def from_uuid(cls, value: uuid.UUID) -> "FriendlyUUID":
+        """Create a FriendlyUUID from a regular UUID."""
+        return cls._from_int_fast(value.int)
+
+    @classmethod
+    def from_friendly(cls, value: str) -> "FriendlyUUID":
+        """Create a FriendlyUUID from its base62 representation."""
+        if not _base62_re.match(value):
+            raise ValueError(f"Not a valid base62 friendly id: {value!r}")
+        value_int = _decode_int(value)
+        if value_int >> 128:
+            raise ValueError("base62 value out of range for a UUID")
+        return cls._from_int_fast(value_int)
+
+    def to_uuid(self) -> uuid.UUID:
+        """Return this id as a plain :class:`uuid.UUID`."""
+        return uuid.UUID(int=self.int)
@@ -0,0 +1,223 @@
+import threading
+import uuid
+
+from sqlalchemy import insert, types
+
+from friendly_id.friendly_id import FriendlyUUID, _standard_cached
+
+
+def _bind_uuid(value):
+    """Bind for dialects with a native uuid type (PostgreSQL)."""
+    # FriendlyUUID is a uuid.UUID, and the pg drivers serialize any
+    # uuid.UUID subclass, so the dominant path is a single isinstance
+    # check and an identity return.
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return _coerce_str_uuid(value)
+
+
+def _coerce_str_uuid(value):
+    # A standard UUID string is 36 chars with a dash at index 8; route it
+    # directly instead of paying for a failed base62 decode.
+    if len(value) == 36 and value[8] == "-":
+        return uuid.UUID(value)
+    return FriendlyUUID.from_friendly(value)
+
+
+def _bind_char(value):
+    """Bind for dialects storing the id as a CHAR(36) string."""
+    if value is None:
+        return None
+    # One subclass-aware check covers FriendlyUUID and uuid.UUID alike;
+    # both format to the same cached hyphenated form.
+    if isinstance(value, uuid.UUID):
+        return _standard_cached(value.int)
+    if len(value) == 36 and value[8] == "-":
+        return str(uuid.UUID(value))
+    return FriendlyUUID.from_friendly(value).standard
+
+
+def _bind_binary(value):
+    """Bind for dialects storing the id as 16 raw bytes (MySQL)."""
+    if value is None:
+        return None
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    if len(value) == 36 and value[8] == "-":
+        return uuid.UUID(value).bytes
+    return FriendlyUUID.from_friendly(value).bytes
+
+
+# Per-dialect (bind, result) pairs, built once per dialect name; see
+# FriendlyUUIDType._processors.
+_dialect_cache: dict = {}
+
+# Dialect-level impl instances, shared so repeated load_dialect_impl
+# calls (statement compilation, cache-key generation) reuse one
+# TypeEngine object per storage form.
+_impl_cache: dict = {}
+
+_random_buffer = threading.local()
+
+
+def random_default() -> FriendlyUUID:
+    """Column default that amortizes entropy reads across bulk inserts.
+
+    ``default=FriendlyUUID.random`` performs one os.urandom syscall per
+    row; this drains a thread-local batch generated with a single read.
+
+    Example:
+        id = Column(FriendlyUUIDType, primary_key=True, default=random_default)
+    """
+    buffer = getattr(_random_buffer, "ids", None)
+    if not buffer:
+        buffer = _random_buffer.ids = FriendlyUUID.random_batch(256)
+    return buffer.pop()
+
+
+def bulk_insert_friendly(session, model, rows, page_size: int = 1000):
+    """Insert ``rows`` with one INSERT ... RETURNING statement.
+
+    Adding and committing one object at a time pays a round trip per
+    row; this compiles a single statement and lets SQLAlchemy's
+    insertmanyvalues batching page the parameters.
+
+    Args:
+        session: an active :class:`~sqlalchemy.orm.Session`.
+        model: the mapped class to insert into.
+        rows: a sequence of parameter dicts.
+        page_size (int): rows per INSERT page.
+
+    Returns:
+        The result with the inserted rows.
+    """
+    stmt = (
+        insert(model)
+        .returning(model)
+        .execution_options(insertmanyvalues_page_size=page_size)
+    )
+    return session.execute(stmt, rows)
+
+
+def _result_uuid(value):
+    if value is None:
+        return None
+    return FriendlyUUID._from_int_fast(value.int)
+
+
+def _result_char(value):
+    if value is None:
+        return None
+    # We wrote the hyphenated form ourselves, so parse the hex directly
+    # instead of building an intermediate uuid.UUID per row. int(.., 16)
+    # performs the charset validation in C; a value that slips past the
+    # shape check falls back to the general uuid.UUID parser.
+    if len(value) == 36 and value[8] == "-":
+        try:
+            return FriendlyUUID._from_int_fast(int(value.replace("-", ""), 16))
+        except ValueError:
+            pass
+    return FriendlyUUID.from_uuid(uuid.UUID(value))
+
+
+def _result_binary(value):
+    if value is None:
+        return None
+    return FriendlyUUID._from_int_fast(int.from_bytes(bytes(value), "big"))
+
+
+class FriendlyUUIDType(types.TypeDecorator):
+    """Column type storing a :class:`FriendlyUUID`.
+
+    Uses PostgreSQL's native UUID type where available and CHAR(36) with
+    the standard hyphenated form elsewhere; values always come back as
+    :class:`FriendlyUUID` instances.
+
+    Result rows are converted by a dialect-specialized closure that
+    SQLAlchemy obtains once per statement, so streaming large result
+    sets with ``yield_per`` costs one attribute read and one
+    construction per row.
+
+    Example:
+        class User(Base):
+            __tablename__ = "users"
+
+            id = Column(
+                FriendlyUUIDType, primary_key=True, default=FriendlyUUID.random
+            )
+    """
+
+    impl = types.CHAR
+    cache_ok = True
+
+    # Store 16 raw bytes on MySQL instead of CHAR(36); halves row and
+    # index bytes. Subclass and set this to False to keep the legacy
+    # string column.
+    mysql_binary = True
+
+    def load_dialect_impl(self, dialect):
+        key = (dialect.name, self.mysql_binary)
+        try:
+            return _impl_cache[key]
+        except KeyError:
+            pass
+        if dialect.name == "postgresql":
+            # Imported here so applications on other backends never pay
+            # for the postgresql dialect package at import time.
+            from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+            impl = dialect.type_descriptor(PG_UUID())
+        elif dialect.name == "mysql" and self.mysql_binary:
+            impl = dialect.type_descriptor(types.BINARY(16))
+        else:
+            impl = dialect.type_descriptor(types.CHAR(36))
+        _impl_cache[key] = impl
+        return impl
+
+    def _processors(self, dialect):
+        # The dialect decides the storage form once; per-value dispatch
+        # below never has to look at it again.
+        key = (dialect.name, self.mysql_binary)
+        try:
+            return _dialect_cache[key]
+        except KeyError:
+            pass
+        if dialect.name == "postgresql":
+            processors = _bind_uuid, _result_uuid
+        elif dialect.name == "mysql" and self.mysql_binary:
+            processors = _bind_binary, _result_binary
+        else:
+            processors = _bind_char, _result_char
+        _dialect_cache[key] = processors
+        return processors
+
+    def process_bind_param(self, value, dialect):
+        return self._processors(dialect)[0](value)
+
+    def process_result_value(self, value, dialect):
+        return self._processors(dialect)[1](value)
+
+    def bind_processor(self, dialect):
+        # SQLAlchemy calls this once per statement; returning the
+        # dialect-specialized closure directly avoids re-checking
+        # dialect.name for every row of an executemany.
+        impl_processor = self.impl_instance.bind_processor(dialect)
+        bind = self._processors(dialect)[0]
+        if impl_processor is None:
+            return bind
+
+        def process(value):
+            return impl_processor(bind(value))
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        impl_processor = self.impl_instance.result_processor(dialect, coltype)
+        result = self._processors(dialect)[1]
+        if impl_processor is None:
+            return result
+
+        def process(value):
+            return result(impl_processor(value))
+
+        return process
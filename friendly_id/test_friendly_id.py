@@ -1,7 +1,7 @@
 import unittest
 
 import uuid
-from friendly_id.friendly_id import encode, decode
+from friendly_id.friendly_id import encode, decode, FriendlyUUID
 
 
 class FriendlyIdTestCase(unittest.TestCase):
@@ -12,3 +12,19 @@ class FriendlyIdTestCase(unittest.TestCase):
     def test_decode(self):
         id = decode("67P7MaJ0NANEBRW3aXfGJ5")
         self.assertEqual(uuid.UUID("c910c385-0486-4eb5-b7fb-f001ac5039e7"), id)
+
+
+class FriendlyUUIDTestCase(unittest.TestCase):
+    def test_str_is_friendly(self):
+        fuid = FriendlyUUID("c910c385-0486-4eb5-b7fb-f001ac5039e7")
+        self.assertEqual("67P7MaJ0NANEBRW3aXfGJ5", str(fuid))
+        self.assertEqual("67P7MaJ0NANEBRW3aXfGJ5", fuid.friendly)
+
+    def test_standard_form(self):
+        fuid = FriendlyUUID("c910c385-0486-4eb5-b7fb-f001ac5039e7")
+        self.assertEqual("c910c385-0486-4eb5-b7fb-f001ac5039e7", fuid.standard)
+
+    def test_round_trip(self):
+        fuid = FriendlyUUID.random()
+        self.assertEqual(fuid, FriendlyUUID.from_friendly(str(fuid)))
+        self.assertEqual(fuid, FriendlyUUID.from_uuid(fuid.to_uuid()))
@@ -0,0 +1,117 @@
+import importlib.util
+import unittest
+import uuid
+
+# find_spec consults the finder caches without executing the package, so
+# an absent dependency is detected without the cost (or the masking of
+# unrelated ImportErrors) of a full trial import.
+PYDANTIC_AVAILABLE = importlib.util.find_spec("pydantic") is not None
+
+if PYDANTIC_AVAILABLE:
+    from pydantic import BaseModel, TypeAdapter, ValidationError
+    from pydantic_core import from_json
+
+    from friendly_id.pydantic_types import PydanticFriendlyUUID
+
+    # Defined once at module scope: pydantic-core compiles a
+    # SchemaValidator/SchemaSerializer per class definition, which is
+    # far too expensive to repeat in setUp for every test.
+    class User(BaseModel):
+        id: PydanticFriendlyUUID
+        name: str
+
+    class UserResponse(BaseModel):
+        user: User
+        status: str
+
+    # Decoded once at import; every test class shares the same constant
+    # fixture, so the base62 decode never runs in test setup at all.
+    FIXED_FRIENDLY_STR = "5wbwf6yUxVBcr48AMbz9cb"
+    FIXED_FRIENDLY_UUID = PydanticFriendlyUUID.from_friendly(FIXED_FRIENDLY_STR)
+
+
+@unittest.skipUnless(PYDANTIC_AVAILABLE, "pydantic is not installed")
+class PydanticIntegrationTestCase(unittest.TestCase):
+    INVALID_INPUTS = (123, 12.34, [], {}, None, "invalid@string")
+
+    @classmethod
+    def setUpClass(cls):
+        # One adapter shared by every dict/JSON validation test;
+        # building a TypeAdapter compiles a validator, so it belongs in
+        # class setup, not in the tests it serves.
+        cls.user_adapter = TypeAdapter(User)
+        # Narrow adapter for the invalid-input loop: only the id field
+        # is under test, so there is no reason to validate a whole model
+        # (and allocate its dict) per rejected value.
+        cls.id_adapter = TypeAdapter(PydanticFriendlyUUID)
+        # The serialization tests all need the same model's JSON; run
+        # the serializer once here instead of once per test.
+        cls.test_user = User(id=FIXED_FRIENDLY_UUID, name="John Doe")
+        cls.test_user_json = cls.test_user.model_dump_json()
+        # model_json_schema walks the core-schema graph on every call
+        # and pydantic does not cache it; generate it once for all
+        # schema assertions.
+        cls.user_json_schema = User.model_json_schema()
+        # uuid4 costs an os.urandom syscall per call; draw the random
+        # fixtures from one pool generated during class setup instead.
+        cls._uuid_pool = [uuid.uuid4() for _ in range(32)]
+
+    def _next_uuid(self) -> uuid.UUID:
+        return self._uuid_pool.pop()
+
+    def test_validation_with_friendly_string(self):
+        user = User(id=FIXED_FRIENDLY_STR, name="John Doe")
+        self.assertIsInstance(user.id, PydanticFriendlyUUID)
+        self.assertEqual(FIXED_FRIENDLY_UUID, user.id)
+
+    def test_validation_with_uuid_string(self):
+        regular_uuid = self._next_uuid()
+        user = User(id=str(regular_uuid), name="John Doe")
+        self.assertIsInstance(user.id, PydanticFriendlyUUID)
+        self.assertEqual(regular_uuid.int, user.id.int)
+
+    def test_validation_with_uuid_object(self):
+        regular_uuid = self._next_uuid()
+        user = User(id=regular_uuid, name="John Doe")
+        self.assertIsInstance(user.id, PydanticFriendlyUUID)
+        self.assertEqual(regular_uuid.int, user.id.int)
+
+    def test_validation_with_friendly_uuid_instance(self):
+        user = User(id=FIXED_FRIENDLY_UUID, name="John Doe")
+        self.assertIs(FIXED_FRIENDLY_UUID, user.id)
+
+    def test_validation_errors(self):
+        for invalid_input in self.INVALID_INPUTS:
+            with self.subTest(invalid_input=invalid_input):
+                with self.assertRaises(ValidationError):
+                    self.id_adapter.validate_python(invalid_input)
+
+    def test_model_validation_from_dict(self):
+        user = self.user_adapter.validate_python(
+            {"id": FIXED_FRIENDLY_STR, "name": "John Doe"}
+        )
+        self.assertEqual(FIXED_FRIENDLY_UUID, user.id)
+
+    def test_serialization_to_json(self):
+        # pydantic_core's Rust parser; ships with pydantic, so the shape
+        # check runs on the same JSON engine as production validation.
+        json_data = from_json(self.test_user_json)
+        self.assertEqual(FIXED_FRIENDLY_STR, json_data["id"])
+        self.assertEqual("John Doe", json_data["name"])
+
+    def test_round_trip_serialization(self):
+        restored = self.user_adapter.validate_json(self.test_user_json)
+        self.assertEqual(self.test_user, restored)
+
+    def test_nested_models(self):
+        response = UserResponse(user=self.test_user, status="ok")
+        # model_validate_json parses and validates in one pass in Rust;
+        # no intermediate dict needed to check the nested structure.
+        restored = UserResponse.model_validate_json(response.model_dump_json())
+        self.assertEqual(FIXED_FRIENDLY_UUID, restored.user.id)
+        self.assertIsInstance(restored.user.id, PydanticFriendlyUUID)
+
+    def test_json_schema_generation(self):
+        id_schema = self.user_json_schema["properties"]["id"]
+        self.assertEqual("string", id_schema["type"])
+        self.assertEqual("^[0-9A-Za-z]{1,22}$", id_schema["pattern"])
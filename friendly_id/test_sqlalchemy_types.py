@@ -0,0 +1,169 @@
+import importlib.util
+import unittest
+import uuid
+from types import SimpleNamespace
+
+# Probe the finder caches instead of trial-importing the package; see
+# test_pydantic_types for the rationale.
+SQLALCHEMY_AVAILABLE = importlib.util.find_spec("sqlalchemy") is not None
+
+if SQLALCHEMY_AVAILABLE:
+    from sqlalchemy import Column, String, create_engine, delete, select, text
+    from sqlalchemy.orm import DeclarativeBase, sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from friendly_id.friendly_id import FriendlyUUID
+    from friendly_id.sqlalchemy_types import FriendlyUUIDType
+
+    class Base(DeclarativeBase):
+        pass
+
+    class User(Base):
+        __tablename__ = "users"
+
+        id = Column(FriendlyUUIDType, primary_key=True, default=FriendlyUUID.random)
+        name = Column(String(50))
+
+
+@unittest.skipUnless(SQLALCHEMY_AVAILABLE, "sqlalchemy is not installed")
+class FriendlyUUIDSQLAlchemyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One engine and one schema for the whole class; declarative
+        # mapper configuration and CREATE TABLE are too expensive to
+        # repeat per test. setUp only wipes rows.
+        # StaticPool pins a single connection for the engine's lifetime:
+        # no per-session checkout work, and every session provably sees
+        # the same in-memory database.
+        cls.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(cls.engine)
+        cls.Session = sessionmaker(bind=cls.engine)
+        # One entropy read covers every test's fixture id; setUp pops
+        # from the pool instead of paying a urandom syscall each time.
+        cls._fuid_pool = FriendlyUUID.random_batch(32)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        with self.Session() as session:
+            session.execute(delete(User))
+            session.commit()
+        self.test_friendly_uuid = self._fuid_pool.pop()
+
+    def test_insert_and_query(self):
+        with self.Session() as session:
+            session.add(User(id=self.test_friendly_uuid, name="John Doe"))
+            # flush is enough when the assertions run in the same
+            # session; it skips SQLite's commit/fsync work.
+            session.flush()
+            # expire_all forces a reload from the database without the
+            # connection churn of opening a second session.
+            session.expire_all()
+            user = session.scalars(select(User).where(User.name == "John Doe")).first()
+            self.assertIsNotNone(user)
+            self.assertIsInstance(user.id, FriendlyUUID)
+            self.assertEqual(self.test_friendly_uuid, user.id)
+
+    def test_default_generation(self):
+        with self.Session() as session:
+            user = User(name="Jane Doe")
+            session.add(user)
+            session.flush()
+            self.assertIsInstance(user.id, FriendlyUUID)
+
+    def test_storage_format(self):
+        with self.Session() as session:
+            session.add(User(id=self.test_friendly_uuid, name="John Doe"))
+            session.commit()
+        with self.Session() as session:
+            raw = session.execute(text("SELECT id FROM users")).scalar_one()
+            self.assertEqual(self.test_friendly_uuid.standard, raw)
+
+    def test_querying_by_friendly_uuid(self):
+        # All four lookup forms hit the same row; one session is enough
+        # and avoids paying connection/transaction setup per query.
+        # session.get is the primary-key path: it consults the identity
+        # map first and otherwise runs a precompiled SELECT, rather than
+        # compiling an ad-hoc WHERE clause per form.
+        with self.Session() as session:
+            session.add(User(id=self.test_friendly_uuid, name="John Doe"))
+            session.flush()
+            for key in (
+                self.test_friendly_uuid,
+                self.test_friendly_uuid.to_uuid(),
+                str(self.test_friendly_uuid),
+                self.test_friendly_uuid.standard,
+            ):
+                with self.subTest(key=key):
+                    user = session.get(User, key)
+                    self.assertIsNotNone(user)
+
+    def test_none_handling(self):
+        # A dedicated base keeps this table's DDL out of the shared
+        # metadata, so create_all does not re-check every other table.
+        class OptionalBase(DeclarativeBase):
+            pass
+
+        class OptionalUser(OptionalBase):
+            __tablename__ = "optional_users"
+
+            pk = Column(String(10), primary_key=True)
+            ref = Column(FriendlyUUIDType, nullable=True)
+
+        OptionalBase.metadata.create_all(self.engine)
+        with self.Session() as session:
+            session.add(OptionalUser(pk="x", ref=None))
+            session.commit()
+        with self.Session() as session:
+            row = session.scalars(
+                select(OptionalUser).where(OptionalUser.pk == "x")
+            ).first()
+            self.assertIsNone(row.ref)
+
+
+@unittest.skipUnless(SQLALCHEMY_AVAILABLE, "sqlalchemy is not installed")
+class FriendlyUUIDTypeDialectsTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Constant, immutable fixtures; building them per test just
+        # repeats the same parse/encode work.
+        cls.test_uuid = uuid.UUID("c910c385-0486-4eb5-b7fb-f001ac5039e7")
+        cls.test_uuid_str = str(cls.test_uuid)
+        cls.test_friendly_uuid = FriendlyUUID.from_uuid(cls.test_uuid)
+        cls.uuid_type = FriendlyUUIDType()
+        # FriendlyUUIDType only reads dialect.name, so a tiny namespace
+        # object is lighter and clearer than a Mock per test.
+        cls.pg_dialect = SimpleNamespace(name="postgresql")
+        cls.sqlite_dialect = SimpleNamespace(name="sqlite")
+        cls.mysql_dialect = SimpleNamespace(name="mysql")
+
+    def test_dialects(self):
+        # One (dialect, bound form, stored form) row per backend; the
+        # loop makes the storage matrix explicit and avoids three copies
+        # of the same assertions.
+        cases = (
+            (self.pg_dialect, self.test_uuid, self.test_uuid),
+            (self.sqlite_dialect, self.test_uuid_str, self.test_uuid_str),
+            (self.mysql_dialect, self.test_uuid.bytes, self.test_uuid.bytes),
+        )
+        for dialect, expected_bound, stored in cases:
+            with self.subTest(dialect=dialect.name):
+                bound = self.uuid_type.process_bind_param(
+                    self.test_friendly_uuid, dialect
+                )
+                self.assertEqual(expected_bound, bound)
+                result = self.uuid_type.process_result_value(stored, dialect)
+                self.assertIsInstance(result, FriendlyUUID)
+                self.assertEqual(self.test_friendly_uuid, result)
+
+    def test_none_values(self):
+        self.assertIsNone(self.uuid_type.process_bind_param(None, self.sqlite_dialect))
+        self.assertIsNone(
+            self.uuid_type.process_result_value(None, self.sqlite_dialect)
+        )